@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Enforce per-section output size and file-count budgets for a docc2context output tree."""
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Top-level sections of a docc2context output directory, keyed by their path prefix relative to
+# the output root. Files that match none of these prefixes are accounted under "other".
+SECTION_PREFIXES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("tutorials", ("markdown", "tutorials")),
+    ("articles", ("markdown", "articles")),
+    ("symbols", ("markdown", "documentation")),
+    ("linkgraph", ("linkgraph",)),
+)
+OTHER_SECTION = "other"
+SECTION_NAMES: Tuple[str, ...] = tuple(name for name, _ in SECTION_PREFIXES) + (OTHER_SECTION,)
+
+
+@dataclass
+class SectionTotals:
+    bytes: int = 0
+    file_count: int = 0
+
+
+@dataclass
+class SectionBudget:
+    max_bytes: Optional[int] = None
+    max_file_count: Optional[int] = None
+
+
+@dataclass
+class FixtureBudget:
+    total: SectionBudget
+    sections: Dict[str, SectionBudget] = field(default_factory=dict)
+
+
+@dataclass
+class OutputTotals:
+    sections: Dict[str, SectionTotals]
+    largest_files: List[Tuple[int, str]]
+
+    @property
+    def bytes(self) -> int:
+        return sum(section.bytes for section in self.sections.values())
+
+    @property
+    def file_count(self) -> int:
+        return sum(section.file_count for section in self.sections.values())
+
+
+@dataclass
+class Violation:
+    scope: str
+    metric: str
+    actual: int
+    limit: int
+
+    @property
+    def ratio(self) -> float:
+        if self.limit == 0:
+            return float("inf")
+        return self.actual / self.limit
+
+
+def repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def section_for(relative_parts: Tuple[str, ...]) -> str:
+    for name, prefix in SECTION_PREFIXES:
+        if len(relative_parts) > len(prefix) and relative_parts[: len(prefix)] == prefix:
+            return name
+    return OTHER_SECTION
+
+
+def iter_regular_files(root: Path) -> Iterator[Tuple[Tuple[str, ...], int]]:
+    """Yield (relative path parts, size in bytes) for every regular file without materialising the tree."""
+    stack: List[Tuple[Path, Tuple[str, ...]]] = [(root, ())]
+    while stack:
+        directory, parts = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                entry_parts = parts + (entry.name,)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((Path(entry.path), entry_parts))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry_parts, entry.stat(follow_symlinks=False).st_size
+
+
+def measure_output(root: Path, top: int) -> OutputTotals:
+    sections: Dict[str, SectionTotals] = {name: SectionTotals() for name in SECTION_NAMES}
+    largest: List[Tuple[int, str]] = []
+
+    for parts, size in iter_regular_files(root):
+        totals = sections[section_for(parts)]
+        totals.bytes += size
+        totals.file_count += 1
+
+        if top > 0:
+            item = (size, "/".join(parts))
+            if len(largest) < top:
+                heapq.heappush(largest, item)
+            elif item > largest[0]:
+                heapq.heapreplace(largest, item)
+
+    return OutputTotals(sections=sections, largest_files=sorted(largest, reverse=True))
+
+
+def parse_section_budget(name: str, raw: Dict) -> SectionBudget:
+    if not isinstance(raw, dict):
+        raise SystemExit(f"Budget for '{name}' must be an object with maxBytes/maxFileCount")
+    budget = SectionBudget()
+    for key, attribute in (("maxBytes", "max_bytes"), ("maxFileCount", "max_file_count")):
+        if key not in raw:
+            continue
+        try:
+            value = int(raw[key])
+        except (TypeError, ValueError):
+            raise SystemExit(f"Budget for '{name}' has invalid {key} value '{raw[key]}'")
+        if value < 0:
+            raise SystemExit(f"Budget for '{name}' has negative {key} value {value}")
+        setattr(budget, attribute, value)
+    return budget
+
+
+def load_fixture_budget(budgets_path: Path, fixture: str) -> FixtureBudget:
+    if not budgets_path.exists():
+        raise SystemExit(f"Budgets file not found at {budgets_path}")
+    try:
+        data = json.loads(budgets_path.read_text())
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Invalid JSON in {budgets_path}: {exc}")
+
+    fixtures = data.get("fixtures", {})
+    if fixture not in fixtures:
+        known = ", ".join(sorted(fixtures)) or "<none>"
+        raise SystemExit(f"No output budget declared for fixture '{fixture}' in {budgets_path} (known: {known})")
+
+    entry = fixtures[fixture]
+    sections: Dict[str, SectionBudget] = {}
+    for name, raw in entry.get("sections", {}).items():
+        if name not in SECTION_NAMES:
+            raise SystemExit(
+                f"Unknown section '{name}' in budget for '{fixture}'. Expected one of: {', '.join(SECTION_NAMES)}"
+            )
+        sections[name] = parse_section_budget(name, raw)
+
+    total_raw = {key: entry[source] for key, source in (("maxBytes", "totalBytes"), ("maxFileCount", "totalFileCount"))
+                 if source in entry}
+    total = parse_section_budget("total", total_raw)
+    return FixtureBudget(total=total, sections=sections)
+
+
+def fixture_from_baseline(baseline_path: Path) -> str:
+    if not baseline_path.exists():
+        raise SystemExit(f"Baseline not found at {baseline_path}; pass --fixture explicitly")
+    try:
+        data = json.loads(baseline_path.read_text())
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Invalid JSON in {baseline_path}: {exc}")
+    fixture = str(data.get("fixturePath", "")).strip()
+    if not fixture:
+        raise SystemExit(f"Baseline {baseline_path} does not declare fixturePath; pass --fixture explicitly")
+    return Path(fixture).name
+
+
+def check_limits(scope: str, totals: SectionTotals, budget: SectionBudget) -> List[Violation]:
+    violations: List[Violation] = []
+    if budget.max_bytes is not None and totals.bytes > budget.max_bytes:
+        violations.append(Violation(scope, "bytes", totals.bytes, budget.max_bytes))
+    if budget.max_file_count is not None and totals.file_count > budget.max_file_count:
+        violations.append(Violation(scope, "files", totals.file_count, budget.max_file_count))
+    return violations
+
+
+def evaluate(totals: OutputTotals, budget: FixtureBudget) -> List[Violation]:
+    violations = check_limits("total", SectionTotals(totals.bytes, totals.file_count), budget.total)
+    for name in SECTION_NAMES:
+        if name in budget.sections:
+            violations.extend(check_limits(name, totals.sections[name], budget.sections[name]))
+    # Rank the largest offenders first: byte overages ahead of file-count overages, each by absolute excess.
+    return sorted(violations, key=lambda v: (v.metric == "bytes", v.actual - v.limit), reverse=True)
+
+
+def format_limit(value: Optional[int]) -> str:
+    return "-" if value is None else str(value)
+
+
+def main(argv: List[str]) -> int:
+    root = repo_root()
+    parser = argparse.ArgumentParser(description="Enforce docc2context output size and file-count budgets")
+    parser.add_argument("output", type=Path, help="docc2context output directory (contains markdown/ and linkgraph/)")
+    parser.add_argument(
+        "--budgets",
+        type=Path,
+        default=root / "Benchmarks" / "output-budgets.json",
+        help="Path to the per-fixture output budgets JSON",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=root / "Benchmarks" / "performance-baseline.json",
+        help="Benchmark baseline used to infer the fixture name when --fixture is omitted",
+    )
+    parser.add_argument("--fixture", default=None, help="Fixture key in the budgets file (defaults to the baseline's fixturePath)")
+    parser.add_argument("--top", type=int, default=10, help="Number of largest files to report (default: 10)")
+
+    args = parser.parse_args(argv)
+    if not args.output.is_dir():
+        raise SystemExit(f"Output directory not found at {args.output}")
+    if args.top < 0:
+        raise SystemExit("--top must be zero or positive")
+
+    fixture = args.fixture or fixture_from_baseline(args.baseline)
+    budget = load_fixture_budget(args.budgets, fixture)
+    totals = measure_output(args.output, args.top)
+
+    print(f"Output budget for {fixture}:")
+    print(f"  total: {totals.bytes} bytes (max {format_limit(budget.total.max_bytes)}), "
+          f"{totals.file_count} files (max {format_limit(budget.total.max_file_count)})")
+    for name in SECTION_NAMES:
+        section = totals.sections[name]
+        limit = budget.sections.get(name, SectionBudget())
+        print(f"  {name}: {section.bytes} bytes (max {format_limit(limit.max_bytes)}), "
+              f"{section.file_count} files (max {format_limit(limit.max_file_count)})")
+
+    violations = evaluate(totals, budget)
+    if not violations:
+        print(f"[OK] Output for {fixture} is within budget.")
+        return 0
+
+    print(f"[ERROR] Output for {fixture} exceeds {len(violations)} budget(s):", file=sys.stderr)
+    for rank, violation in enumerate(violations, start=1):
+        over = violation.actual - violation.limit
+        ratio = "n/a" if violation.limit == 0 else f"{violation.ratio:.2f}x"
+        print(
+            f"  {rank}. {violation.scope} {violation.metric}: {violation.actual} > {violation.limit} "
+            f"(+{over}, {ratio})",
+            file=sys.stderr,
+        )
+    if totals.largest_files:
+        print("Largest files:", file=sys.stderr)
+        for rank, (size, path) in enumerate(totals.largest_files, start=1):
+            print(f"  {rank}. {path} ({size} bytes, {section_for(tuple(path.split('/')))})", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,175 @@
+import Foundation
+import XCTest
+
+final class OutputBudgetScriptTests: XCTestCase {
+
+    private func scriptURL() -> URL {
+        return TestSupportPaths.repositoryRootDirectory
+            .appendingPathComponent("Scripts", isDirectory: true)
+            .appendingPathComponent("check_output_budget.py")
+    }
+
+    private func python3Available() -> Bool {
+        let process = Process()
+        process.executableURL = URL(fileURLWithPath: "/usr/bin/env")
+        process.arguments = ["python3", "--version"]
+        let pipe = Pipe()
+        process.standardOutput = pipe
+        process.standardError = pipe
+        do {
+            try process.run()
+            process.waitUntilExit()
+            return process.terminationStatus == 0
+        } catch {
+            return false
+        }
+    }
+
+    private func runScript(arguments: [String]) throws -> (exitCode: Int32, output: String) {
+        let process = Process()
+        process.currentDirectoryURL = TestSupportPaths.repositoryRootDirectory
+        process.executableURL = URL(fileURLWithPath: "/usr/bin/env")
+        process.arguments = ["python3", scriptURL().path] + arguments
+
+        let pipe = Pipe()
+        process.standardOutput = pipe
+        process.standardError = pipe
+
+        try process.run()
+        process.waitUntilExit()
+
+        let outputData = pipe.fileHandleForReading.readDataToEndOfFile()
+        let output = String(data: outputData, encoding: .utf8) ?? "<unreadable>"
+
+        return (process.terminationStatus, output)
+    }
+
+    private func makeTemporaryDirectory() throws -> URL {
+        let tempDir = FileManager.default.temporaryDirectory
+            .appendingPathComponent(UUID().uuidString, isDirectory: true)
+        try FileManager.default.createDirectory(at: tempDir, withIntermediateDirectories: true)
+        return tempDir
+    }
+
+    private func writeFile(_ relativePath: String, bytes: Int, under root: URL) throws {
+        let url = root.appendingPathComponent(relativePath, isDirectory: false)
+        try FileManager.default.createDirectory(
+            at: url.deletingLastPathComponent(),
+            withIntermediateDirectories: true)
+        try Data(repeating: 0x61, count: bytes).write(to: url)
+    }
+
+    private func writeBudgets(to url: URL) throws {
+        let json = """
+        {
+          "fixtures": {
+            "Sample.doccarchive": {
+              "totalBytes": 4096,
+              "totalFileCount": 8,
+              "sections": {
+                "articles": { "maxBytes": 2048, "maxFileCount": 4 },
+                "symbols": { "maxBytes": 1024, "maxFileCount": 4 },
+                "linkgraph": { "maxBytes": 256, "maxFileCount": 1 }
+              }
+            }
+          }
+        }
+        """
+        try json.write(to: url, atomically: true, encoding: .utf8)
+    }
+
+    func test_scriptExists() throws {
+        XCTAssertTrue(
+            FileManager.default.fileExists(atPath: scriptURL().path),
+            "check_output_budget.py script must exist in Scripts/ directory"
+        )
+    }
+
+    func test_committedBudgetsCoverBaselineFixture() throws {
+        let benchmarks = TestSupportPaths.repositoryRootDirectory
+            .appendingPathComponent("Benchmarks", isDirectory: true)
+        let baselineData = try Data(contentsOf: benchmarks.appendingPathComponent("performance-baseline.json"))
+        let budgetsData = try Data(contentsOf: benchmarks.appendingPathComponent("output-budgets.json"))
+
+        let baseline = try XCTUnwrap(JSONSerialization.jsonObject(with: baselineData) as? [String: Any])
+        let budgets = try XCTUnwrap(JSONSerialization.jsonObject(with: budgetsData) as? [String: Any])
+        let fixtures = try XCTUnwrap(budgets["fixtures"] as? [String: Any])
+        let fixturePath = try XCTUnwrap(baseline["fixturePath"] as? String)
+
+        XCTAssertNotNil(fixtures[fixturePath], "output-budgets.json must declare a budget for \(fixturePath)")
+    }
+
+    func test_outputWithinBudgetPasses() throws {
+        guard python3Available() else {
+            throw XCTSkip("python3 is required for output budget tests")
+        }
+        let tempDir = try makeTemporaryDirectory()
+        defer { try? FileManager.default.removeItem(at: tempDir) }
+
+        let outputDir = tempDir.appendingPathComponent("output", isDirectory: true)
+        try writeFile("markdown/articles/overview.md", bytes: 512, under: outputDir)
+        try writeFile("markdown/documentation/sample/index.md", bytes: 256, under: outputDir)
+        try writeFile("linkgraph/adjacency.json", bytes: 128, under: outputDir)
+        let budgetsURL = tempDir.appendingPathComponent("budgets.json")
+        try writeBudgets(to: budgetsURL)
+
+        let (exitCode, output) = try runScript(arguments: [
+            outputDir.path,
+            "--budgets", budgetsURL.path,
+            "--fixture", "Sample.doccarchive"
+        ])
+
+        XCTAssertEqual(exitCode, 0, "Script should pass when output is within budget: \(output)")
+        XCTAssertTrue(output.contains("articles: 512 bytes"), "Per-section totals must be reported: \(output)")
+        XCTAssertTrue(output.contains("[OK]"), "Success marker must be printed: \(output)")
+    }
+
+    func test_exceededBudgetFailsWithRankedOffenders() throws {
+        guard python3Available() else {
+            throw XCTSkip("python3 is required for output budget tests")
+        }
+        let tempDir = try makeTemporaryDirectory()
+        defer { try? FileManager.default.removeItem(at: tempDir) }
+
+        let outputDir = tempDir.appendingPathComponent("output", isDirectory: true)
+        try writeFile("markdown/articles/overview.md", bytes: 512, under: outputDir)
+        try writeFile("markdown/documentation/sample/index.md", bytes: 1200, under: outputDir)
+        try writeFile("linkgraph/adjacency.json", bytes: 2048, under: outputDir)
+        let budgetsURL = tempDir.appendingPathComponent("budgets.json")
+        try writeBudgets(to: budgetsURL)
+
+        let (exitCode, output) = try runScript(arguments: [
+            outputDir.path,
+            "--budgets", budgetsURL.path,
+            "--fixture", "Sample.doccarchive",
+            "--top", "2"
+        ])
+
+        XCTAssertNotEqual(exitCode, 0, "Script should fail when a section exceeds its budget: \(output)")
+        XCTAssertTrue(output.contains("1. linkgraph bytes: 2048 > 256"), "Largest overage must rank first: \(output)")
+        XCTAssertTrue(output.contains("2. symbols bytes: 1200 > 1024"), "Smaller overage must rank second: \(output)")
+        XCTAssertTrue(output.contains("1. linkgraph/adjacency.json (2048 bytes, linkgraph)"),
+                      "Largest files must be listed: \(output)")
+        XCTAssertFalse(output.contains("overview.md"), "Only the requested number of largest files is listed: \(output)")
+    }
+
+    func test_unknownFixtureFails() throws {
+        guard python3Available() else {
+            throw XCTSkip("python3 is required for output budget tests")
+        }
+        let tempDir = try makeTemporaryDirectory()
+        defer { try? FileManager.default.removeItem(at: tempDir) }
+
+        let budgetsURL = tempDir.appendingPathComponent("budgets.json")
+        try writeBudgets(to: budgetsURL)
+
+        let (exitCode, output) = try runScript(arguments: [
+            tempDir.path,
+            "--budgets", budgetsURL.path,
+            "--fixture", "Missing.doccarchive"
+        ])
+
+        XCTAssertNotEqual(exitCode, 0, "Script should fail for fixtures without a budget: \(output)")
+        XCTAssertTrue(output.contains("No output budget declared for fixture 'Missing.doccarchive'"))
+    }
+}